@@ -19,64 +19,65 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database (participants are insertion-ordered dicts
+# used as ordered sets for O(1) lookups)
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     # Sports related activities
     "Soccer Team": {
         "description": "Join the school soccer team and compete in local leagues",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 18,
-        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
+        "participants": dict.fromkeys(["lucas@mergington.edu", "mia@mergington.edu"])
     },
     "Basketball Club": {
         "description": "Practice basketball skills and play friendly matches",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["liam@mergington.edu", "ava@mergington.edu"]
+        "participants": dict.fromkeys(["liam@mergington.edu", "ava@mergington.edu"])
     },
     # Artistic activities
     "Art Club": {
         "description": "Explore painting, drawing, and other visual arts",
         "schedule": "Mondays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["ella@mergington.edu", "noah@mergington.edu"]
+        "participants": dict.fromkeys(["ella@mergington.edu", "noah@mergington.edu"])
     },
     "Drama Society": {
         "description": "Participate in acting, stage production, and school plays",
         "schedule": "Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["amelia@mergington.edu", "jack@mergington.edu"]
+        "participants": dict.fromkeys(["amelia@mergington.edu", "jack@mergington.edu"])
     },
     # Intellectual activities
     "Math Olympiad": {
         "description": "Prepare for math competitions and solve challenging problems",
         "schedule": "Fridays, 2:00 PM - 3:30 PM",
         "max_participants": 10,
-        "participants": ["ethan@mergington.edu", "grace@mergington.edu"]
+        "participants": dict.fromkeys(["ethan@mergington.edu", "grace@mergington.edu"])
     },
     "Science Club": {
         "description": "Conduct experiments and explore scientific concepts",
         "schedule": "Wednesdays, 4:00 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["chloe@mergington.edu", "benjamin@mergington.edu"]
+        "participants": dict.fromkeys(["chloe@mergington.edu", "benjamin@mergington.edu"])
     }
 }
 
@@ -88,7 +89,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Serialize participants as lists, in signup order
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -105,7 +110,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is already signed up for this activity")
     
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -124,5 +129,5 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is not registered for this activity")
     
     # Remove student
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
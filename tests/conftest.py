@@ -5,13 +5,15 @@ This module provides common test fixtures and configuration
 that can be used across all test modules.
 """
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from src.app import app
 
 
 @pytest.fixture(scope="session")
-def test_client():
+def client():
     """
     Create a test client for the FastAPI application.
     Session-scoped to avoid creating multiple clients.
@@ -19,18 +21,12 @@ def test_client():
     return TestClient(app)
 
 
-# Pytest configuration
-pytest_plugins = []
-
-# Configure test markers
-def pytest_configure(config):
-    """Configure custom pytest markers."""
-    config.addinivalue_line(
-        "markers", "integration: mark test as an integration test"
-    )
-    config.addinivalue_line(
-        "markers", "unit: mark test as a unit test"
-    )
-    config.addinivalue_line(
-        "markers", "api: mark test as an API test"
-    )
\ No newline at end of file
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """
+    Create an async client that calls the application over ASGI directly.
+    Avoids the thread/event-loop bridge TestClient adds to every request.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client